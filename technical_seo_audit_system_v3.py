@@ -7,21 +7,32 @@ import requests
 import json
 import time
 import os
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass, asdict
+import sys
+import functools
+import hashlib
+import sqlite3
+import threading
+import random
+from datetime import date, datetime, timezone, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass
 from google.cloud import bigquery
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import requests.utils
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import logging
 from urllib.parse import urljoin, urlparse
-import xml.etree.ElementTree as ET
+from lxml import etree
 import re
+import operator
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
+from bs4 import BeautifulSoup, SoupStrainer
 
 # Load environment variables
 load_dotenv()
@@ -30,8 +41,48 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# XML namespace prefix for sitemap elements
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+# Levels of nested sitemap indexes crawl_sitemap follows (index -> urlset is 1)
+SITEMAP_MAX_DEPTH = 2
+
+# Max GSC searchanalytics queries bundled into one batch HTTP request
+GSC_BATCH_SIZE = 20
+
+# Rows requested per searchanalytics query. The API orders rows by clicks and
+# cannot sort by impressions, so the top pages by impressions can only be
+# found by fetching a large slice and re-sorting it client-side
+GSC_ROW_LIMIT = 1000
+
+# Generic/non-descriptive title fragments, matched in a single scan
+GENERIC_TITLE_PATTERN = re.compile(
+    '|'.join(re.escape(p) for p in ['untitled', 'new page', 'home page', 'welcome', 'default', 'page'])
+)
+
+# Acceptable (min, max) character lengths; outside them a Short/Long issue is raised
+TITLE_LENGTH_RANGE = (30, 70)
+META_DESCRIPTION_LENGTH_RANGE = (120, 170)
+
+# Tags WebCrawler.crawl_url extracts; everything else is skipped while parsing
+CRAWL_STRAINER = SoupStrainer(['title', 'meta', 'link', 'h1', 'a', 'img'])
+
+def _stripped_if_longer(text: Optional[str], min_length: int) -> Optional[str]:
+    """Return text stripped if it is still longer than min_length, else None"""
+    # Stripping can only shorten, so values already too short skip the strip
+    if not text or len(text) <= min_length:
+        return None
+    text = text.strip()
+    return text if len(text) > min_length else None
+
 @dataclass
 class TechnicalSEOIssue:
+    # Audits create many issues; slots keep them compact (no per-instance __dict__)
+    __slots__ = (
+        'url', 'issue_type', 'severity', 'category', 'description',
+        'recommendation', 'date_detected', 'status', 'impact_score'
+    )
+    
     url: str
     issue_type: str
     severity: str  # 'Critical', 'High', 'Medium', 'Low'
@@ -42,6 +93,13 @@ class TechnicalSEOIssue:
     status: str  # 'New', 'Existing', 'Fixed'
     impact_score: int  # 1-100
 
+# Exported issue fields (date_detected is serialized separately)
+_ISSUE_EXPORT_FIELDS = (
+    'url', 'issue_type', 'severity', 'category', 'description',
+    'recommendation', 'impact_score', 'status'
+)
+_get_issue_export_values = operator.attrgetter(*_ISSUE_EXPORT_FIELDS)
+
 @dataclass
 class GSCMetrics:
     url: str
@@ -66,6 +124,10 @@ class CrawlMetrics:
     external_links: int
     images_without_alt: int
     page_size: int
+    
+    def to_dict(self) -> Dict:
+        """Shallow dict of the metrics (asdict would deep-copy every field)"""
+        return self.__dict__.copy()
 
 class GoogleSearchConsoleAPI:
     def __init__(self, credentials_path: str):
@@ -92,69 +154,113 @@ class GoogleSearchConsoleAPI:
             logger.error(f"Error fetching sites: {e}")
             return []
     
-    def get_coverage_issues(self, site_url: str, days_back: int = 30, top_pages_limit: int = 10) -> List[GSCMetrics]:
-        """Get search analytics data from GSC using OAuth2 with top pages by impressions"""
+    def _build_search_analytics_body(self, days_back: int) -> Tuple[Dict, date]:
+        """Build the searchanalytics query body and return it with the end date"""
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=days_back)
         
+        request_body = {
+            'startDate': start_date.strftime('%Y-%m-%d'),
+            'endDate': end_date.strftime('%Y-%m-%d'),
+            'dimensions': ['page'],
+            'rowLimit': GSC_ROW_LIMIT
+        }
+        return request_body, end_date
+    
+    def _parse_search_analytics(self, site_url: str, response: Dict, end_date: date, top_pages_limit: int) -> List[GSCMetrics]:
+        """Convert a searchanalytics response into the top pages by impressions"""
+        rows = response.get('rows', [])
+        
+        # Rank the (up to GSC_ROW_LIMIT) rows by impressions on a precomputed key
+        # list, and only build GSCMetrics for the top pages
+        impressions_by_row = [row.get('impressions', 0) for row in rows]
+        top_rows = sorted(range(len(rows)), key=impressions_by_row.__getitem__, reverse=True)[:top_pages_limit]
+        
+        coverage_metrics = []
+        for row in (rows[i] for i in top_rows):
+            page_url = row.get('keys', [''])[0]
+            clicks = row.get('clicks', 0)
+            impressions = row.get('impressions', 0)
+            ctr = row.get('ctr', clicks/impressions if impressions > 0 else 0)
+            position = row.get('position', 0)
+            
+            coverage_metrics.append(GSCMetrics(
+                url=page_url,
+                date=end_date.strftime('%Y-%m-%d'),
+                coverage_status='Valid',  # Assume valid if showing in search analytics
+                error_type=None,
+                mobile_usability_issues=[],
+                page_experience_signals={
+                    'clicks': clicks,
+                    'impressions': impressions,
+                    'ctr': ctr,
+                    'position': position,
+                    'domain': site_url
+                },
+                crawl_stats={}
+            ))
+        
+        logger.info(f"Found {len(rows)} pages for {site_url}, returning top {top_pages_limit}")
+        
+        return coverage_metrics
+    
+    def get_coverage_issues(self, site_url: str, days_back: int = 30, top_pages_limit: int = 10) -> List[GSCMetrics]:
+        """Get search analytics data from GSC using OAuth2 with top pages by impressions"""
+        request_body, end_date = self._build_search_analytics_body(days_back)
+        
         try:
-            request_body = {
-                'startDate': start_date.strftime('%Y-%m-%d'),
-                'endDate': end_date.strftime('%Y-%m-%d'),
-                'dimensions': ['page'],
-                'rowLimit': 1000
-            }
-            
             response = self.service.searchanalytics().query(
                 siteUrl=site_url,
                 body=request_body
             ).execute()
             
-            # Process search analytics data
-            coverage_metrics = []
-            for row in response.get('rows', []):
-                page_url = row.get('keys', [''])[0]
-                clicks = row.get('clicks', 0)
-                impressions = row.get('impressions', 0)
-                ctr = row.get('ctr', clicks/impressions if impressions > 0 else 0)
-                position = row.get('position', 0)
-                
-                coverage_metrics.append(GSCMetrics(
-                    url=page_url,
-                    date=end_date.strftime('%Y-%m-%d'),
-                    coverage_status='Valid',  # Assume valid if showing in search analytics
-                    error_type=None,
-                    mobile_usability_issues=[],
-                    page_experience_signals={
-                        'clicks': clicks,
-                        'impressions': impressions,
-                        'ctr': ctr,
-                        'position': position,
-                        'domain': site_url
-                    },
-                    crawl_stats={}
-                ))
-            
-            # Sort by impressions and return top pages
-            coverage_metrics.sort(key=lambda x: x.page_experience_signals.get('impressions', 0), reverse=True)
-            logger.info(f"Found {len(coverage_metrics)} pages for {site_url}, returning top {top_pages_limit}")
-            
-            return coverage_metrics[:top_pages_limit]
+            return self._parse_search_analytics(site_url, response, end_date, top_pages_limit)
             
         except Exception as e:
             logger.error(f"Error fetching search analytics data for {site_url}: {e}")
             return []
     
     def get_multi_domain_coverage(self, site_urls: List[str], days_back: int = 30, top_pages_per_domain: int = 10) -> Dict[str, List[GSCMetrics]]:
-        """Get coverage issues for multiple GSC domain properties"""
+        """Get coverage issues for multiple GSC domain properties
+        
+        Queries are sent as batched HTTP requests (GSC_BATCH_SIZE per batch)
+        instead of one round-trip per property.
+        """
+        request_body, end_date = self._build_search_analytics_body(days_back)
         all_coverage_data = {}
         
-        for site_url in site_urls:
-            logger.info(f"Fetching GSC data for {site_url}...")
-            coverage_data = self.get_coverage_issues(site_url, days_back, top_pages_per_domain)
-            all_coverage_data[site_url] = coverage_data
-            
-        return all_coverage_data
+        def handle_response(site_url: str, response: Optional[Dict], exception: Optional[Exception]) -> None:
+            if exception is not None:
+                logger.error(f"Error fetching search analytics data for {site_url}: {exception}")
+                all_coverage_data[site_url] = []
+                return
+            try:
+                all_coverage_data[site_url] = self._parse_search_analytics(
+                    site_url, response, end_date, top_pages_per_domain
+                )
+            except Exception as e:
+                logger.error(f"Error processing search analytics data for {site_url}: {e}")
+                all_coverage_data[site_url] = []
+        
+        for i in range(0, len(site_urls), GSC_BATCH_SIZE):
+            batch_urls = site_urls[i:i + GSC_BATCH_SIZE]
+            logger.info(f"Fetching GSC data for {', '.join(batch_urls)}...")
+            batch = self.service.new_batch_http_request()
+            for site_url in batch_urls:
+                batch.add(
+                    self.service.searchanalytics().query(siteUrl=site_url, body=request_body),
+                    callback=lambda request_id, response, exception, site_url=site_url:
+                        handle_response(site_url, response, exception)
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.error(f"Error executing GSC batch request: {e}")
+                for site_url in batch_urls:
+                    all_coverage_data.setdefault(site_url, [])
+        
+        # Preserve the caller's property order
+        return {site_url: all_coverage_data.get(site_url, []) for site_url in site_urls}
     
     def get_mobile_usability_issues(self, site_url: str) -> List[Dict]:
         """Get mobile usability issues using OAuth2"""
@@ -167,31 +273,65 @@ class GoogleSearchConsoleAPI:
             logger.error(f"Error fetching mobile usability issues: {e}")
             return []
 
+def make_session(pool_size: int = 32) -> requests.Session:
+    """Create an HTTP session with a pooled adapter for keep-alive reuse
+    
+    The adapter only retries failed connection attempts, immediately and
+    without backoff. Read timeouts and error statuses are returned to the
+    caller as-is (PageSpeedCollector applies its own backoff), so a hung
+    request isn't silently repeated and crawl timings aren't inflated.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 class WebCrawler:
-    def __init__(self, max_workers: int = 5, timeout: int = 30):
+    # Sent per request: the session may be shared with the PSI and schema clients,
+    # which shouldn't identify as the crawler bot
+    HEADERS = {
+        'User-Agent': 'SEO-Audit-Bot/1.0 (+https://yoursite.com/bot)'
+    }
+    
+    def __init__(self, max_workers: int = 5, timeout: int = 30, session: Optional[requests.Session] = None):
         self.max_workers = max_workers
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'SEO-Audit-Bot/1.0 (+https://yoursite.com/bot)'
-        })
+        self.session = session or make_session()
     
     def crawl_url(self, url: str) -> Optional[CrawlMetrics]:
         """Crawl a single URL and extract technical SEO data"""
+        crawl_result = self.crawl_url_with_content(url)
+        return crawl_result[0] if crawl_result else None
+    
+    def crawl_url_with_content(self, url: str) -> Optional[Tuple[CrawlMetrics, bytes]]:
+        """Crawl a single URL, also returning the raw response body for reuse"""
         try:
             start_time = time.time()
-            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+            response = self.session.get(url, headers=self.HEADERS, timeout=self.timeout, allow_redirects=True)
             response_time = time.time() - start_time
             
-            # Parse HTML content
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Parse HTML content (only the tags the audit reads)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=CRAWL_STRAINER)
             
             # Extract SEO elements
-            title = soup.find('title').get_text().strip() if soup.find('title') else ''
+            title_tag = soup.find('title')
+            title = title_tag.get_text().strip() if title_tag else ''
+            
+            # Description and robots metas in one pass (first of each wins)
+            meta_desc_tag = robots_tag = None
+            for meta_tag in soup.find_all('meta', attrs={'name': True}):
+                meta_name = meta_tag.get('name')
+                if meta_name == 'description' and meta_desc_tag is None:
+                    meta_desc_tag = meta_tag
+                elif meta_name == 'robots' and robots_tag is None:
+                    robots_tag = meta_tag
             
             meta_desc = ''
-            meta_desc_tag = soup.find('meta', attrs={'name': 'description'})
             if meta_desc_tag:
                 meta_desc = meta_desc_tag.get('content', '').strip()
             
@@ -203,21 +343,23 @@ class WebCrawler:
                 canonical_url = canonical_tag.get('href')
             
             robots_meta = ''
-            robots_tag = soup.find('meta', attrs={'name': 'robots'})
             if robots_tag:
                 robots_meta = robots_tag.get('content', '')
             
-            # Count links
-            internal_links = len([a for a in soup.find_all('a', href=True) 
-                                if self._is_internal_link(a['href'], url)])
-            external_links = len([a for a in soup.find_all('a', href=True) 
-                                if not self._is_internal_link(a['href'], url)])
+            # Count links, bucketing internal/external in a single pass
+            base_netloc = urlparse(url).netloc
+            internal_links = external_links = 0
+            for a in soup.find_all('a', href=True):
+                if self._is_internal_link(a['href'], base_netloc):
+                    internal_links += 1
+                else:
+                    external_links += 1
             
             # Count images without alt text
             images_without_alt = len([img for img in soup.find_all('img') 
                                     if not img.get('alt', '').strip()])
             
-            return CrawlMetrics(
+            crawl_metrics = CrawlMetrics(
                 url=url,
                 status_code=response.status_code,
                 response_time=response_time,
@@ -231,31 +373,57 @@ class WebCrawler:
                 images_without_alt=images_without_alt,
                 page_size=len(response.content)
             )
+            return crawl_metrics, response.content
             
         except Exception as e:
             logger.error(f"Error crawling {url}: {e}")
             return None
     
-    def _is_internal_link(self, href: str, base_url: str) -> bool:
-        """Check if a link is internal"""
+    def _is_internal_link(self, href: str, base_netloc: str) -> bool:
+        """Check if a link is internal to the page's (pre-parsed) netloc"""
         if href.startswith('http'):
-            return urlparse(href).netloc == urlparse(base_url).netloc
+            return urlparse(href).netloc == base_netloc
         return True  # Relative links are internal
     
-    def crawl_sitemap(self, sitemap_url: str) -> List[str]:
-        """Extract URLs from XML sitemap"""
+    def crawl_sitemap(self, sitemap_url: str, seen: Optional[Set[str]] = None, depth: int = 0) -> List[str]:
+        """Extract URLs from XML sitemap (sitemap indexes are followed)
+        
+        Each sitemap is fetched at most once per call tree (seen), and nested
+        indexes are followed at most SITEMAP_MAX_DEPTH levels deep, so
+        self-referencing or cyclic indexes terminate.
+        """
+        if seen is None:
+            seen = set()
+        seen.add(sitemap_url)
+        
         try:
-            response = self.session.get(sitemap_url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            root = ET.fromstring(response.content)
-            urls = []
-            
-            # Handle different sitemap formats
-            for url_elem in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url'):
-                loc = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                if loc is not None:
-                    urls.append(loc.text)
+            # The with block returns the streamed connection to the shared pool
+            # even when parsing or a nested sitemap fails
+            with self.session.get(sitemap_url, headers=self.HEADERS, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                urls = []
+                
+                # Stream <url>/<sitemap> entries instead of loading the whole document
+                for _, elem in etree.iterparse(response.raw, tag=(SITEMAP_NS + 'url', SITEMAP_NS + 'sitemap')):
+                    loc = elem.findtext(SITEMAP_NS + 'loc')
+                    if loc:
+                        if elem.tag == SITEMAP_NS + 'sitemap':
+                            # Skip sitemaps already fetched (self-references, cycles)
+                            child_url = loc.strip()
+                            if child_url not in seen:
+                                if depth < SITEMAP_MAX_DEPTH:
+                                    urls.extend(self.crawl_sitemap(child_url, seen, depth + 1))
+                                else:
+                                    logger.warning(f"Not following nested sitemap {child_url}: max depth {SITEMAP_MAX_DEPTH} reached")
+                        else:
+                            urls.append(loc.strip())
+                
+                    # Free processed entries so memory stays flat on large sitemaps
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
             
             return urls
             
@@ -263,11 +431,55 @@ class WebCrawler:
             logger.error(f"Error parsing sitemap {sitemap_url}: {e}")
             return []
 
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter"""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate  # tokens added per second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 class PageSpeedCollector:
     """Built-in PageSpeed Insights collector"""
-    def __init__(self, api_key: str):
+    # PSI allows 400 queries per 100 seconds per key
+    RATE_PER_SECOND = 4.0
+    BURST = 25
+    MAX_RETRIES = 4
+    
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
         self.api_key = api_key
+        self.session = session or make_session()
         self.base_url = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+        self.rate_limiter = TokenBucket(rate=self.RATE_PER_SECOND, capacity=self.BURST)
+    
+    def _get_with_backoff(self, params: Dict) -> requests.Response:
+        """GET the PSI endpoint, retrying 429/5xx responses with exponential backoff"""
+        for attempt in range(self.MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            response = self.session.get(self.base_url, params=params, timeout=60)
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt == self.MAX_RETRIES:
+                response.raise_for_status()
+                return response
+            
+            backoff = min(60, 2 ** attempt + random.random())
+            logger.warning(f"PageSpeed returned {response.status_code} for {params['url']}, retrying in {backoff:.1f}s")
+            time.sleep(backoff)
     
     def get_page_speed_data(self, url: str, strategy: str = 'mobile') -> Dict:
         """Get PageSpeed Insights data for a URL"""
@@ -280,8 +492,7 @@ class PageSpeedCollector:
         }
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=60)
-            response.raise_for_status()
+            response = self._get_with_backoff(params)
             data = response.json()
             
             # Extract key metrics
@@ -337,28 +548,34 @@ class PageSpeedCollector:
         return opportunities
 
 class SchemaValidator:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or make_session()
         self.schema_types = [
             'Organization', 'WebSite', 'WebPage', 'BreadcrumbList',
             'Product', 'Review', 'Person', 'Article', 'LocalBusiness'
         ]
     
-    def validate_structured_data(self, url: str) -> Dict:
-        """Validate structured data using Google's Structured Data Testing Tool"""
+    def validate_structured_data(self, url: str, content: Optional[bytes] = None) -> Dict:
+        """Validate structured data using Google's Structured Data Testing Tool
+        
+        Args:
+            url: Page URL
+            content: Already-fetched page body (e.g. from the crawl); fetched if omitted
+        """
         api_url = "https://search.google.com/test/rich-results"
         
         # Note: Google's Rich Results Test doesn't have a direct API
         # This would need to use web scraping or alternative validation
         
         # Alternative: Use schema.org validator
-        return self._validate_with_schemaorg(url)
+        return self._validate_with_schemaorg(url, content)
     
-    def _validate_with_schemaorg(self, url: str) -> Dict:
+    def _validate_with_schemaorg(self, url: str, content: Optional[bytes] = None) -> Dict:
         """Validate using schema.org principles"""
         try:
-            response = requests.get(url, timeout=30)
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if content is None:
+                content = self.session.get(url, timeout=30).content
+            soup = BeautifulSoup(content, 'lxml')
             
             # Find JSON-LD structured data
             json_ld_scripts = soup.find_all('script', type='application/ld+json')
@@ -417,6 +634,46 @@ class SchemaValidator:
         
         return recommendations
 
+class AuditResultCache:
+    """Persistent sqlite cache for slow per-URL results (PageSpeed, schema)"""
+    
+    def __init__(self, path: str = 'audit_cache.db', ttl_days: int = 7):
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self._lock = threading.Lock()
+        # Shared across the audit's worker threads; access is serialized by the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts INTEGER, payload BLOB)"
+            )
+    
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Build a cache key from its parts (e.g. kind, url, strategy, content hash)"""
+        return json.dumps(parts)
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached payload for key, or None if missing or expired"""
+        min_ts = int(time.time()) - self.ttl_seconds
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM cache WHERE key = ? AND ts >= ?", (key, min_ts)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def set(self, key: str, payload: Dict) -> None:
+        """Store payload under key"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, ts, payload) VALUES (?, ?, ?)",
+                (key, int(time.time()), json.dumps(payload, default=str))
+            )
+    
+    def close(self) -> None:
+        """Close the underlying sqlite connection"""
+        with self._lock:
+            self._conn.close()
+
 class StrategicSEOScorer:
     """Strategic SEO scoring based on Google ranking factors and business impact"""
     
@@ -482,60 +739,142 @@ class StrategicSEOScorer:
             'blog': 2.0,
             'other': 2.0
         }
+        
+        # URL substrings per page type, compiled once; checked in priority order
+        # (a single alternation would return the leftmost match instead)
+        self._page_type_patterns = [
+            (page_type, re.compile('|'.join(re.escape(p) for p in patterns)))
+            for page_type, patterns in [
+                ('product', ['/product', '/p/', 'photo-blankets', 'photo-books', 'photo-mugs']),
+                ('category', ['/category', '/c/', '/canvas-prints', '/photo-calendars']),
+                ('checkout', ['/checkout', '/cart', '/basket']),
+                ('about', ['/about', '/company']),
+                ('contact', ['/contact', '/support']),
+                ('blog', ['/blog', '/news']),
+            ]
+        ]
+        self._page_type_cache = {}
+        
+        # Strategic impact for every known (issue_type, page_type) pair
+        self._impact_table = {
+            (issue_type, page_type): self._scale_impact(base_impact, page_weight)
+            for issue_type, base_impact in self.issue_severity.items()
+            for page_type, page_weight in self.page_weights.items()
+        }
     
     def classify_page_type(self, url: str) -> str:
-        """Classify page type for business importance weighting"""
+        """Classify page type for business importance weighting (memoized per URL)"""
+        page_type = self._page_type_cache.get(url)
+        if page_type is None:
+            page_type = self._page_type_cache[url] = self._classify_page_type(url)
+        return page_type
+    
+    def _classify_page_type(self, url: str) -> str:
+        """Classify a URL by its path patterns"""
         url_lower = url.lower()
         
-        if any(pattern in url_lower for pattern in ['/', '/home', '/index']) and url_lower.count('/') <= 3:
+        # Shallow URLs ('/', '/home', '/index', ...) are homepages
+        if '/' in url_lower and url_lower.count('/') <= 3:
             return 'homepage'
-        elif any(pattern in url_lower for pattern in ['/product', '/p/', 'photo-blankets', 'photo-books', 'photo-mugs']):
-            return 'product'
-        elif any(pattern in url_lower for pattern in ['/category', '/c/', '/canvas-prints', '/photo-calendars']):
-            return 'category' 
-        elif any(pattern in url_lower for pattern in ['/checkout', '/cart', '/basket']):
-            return 'checkout'
-        elif any(pattern in url_lower for pattern in ['/about', '/company']):
-            return 'about'
-        elif any(pattern in url_lower for pattern in ['/contact', '/support']):
-            return 'contact'
-        elif any(pattern in url_lower for pattern in ['/blog', '/news']):
-            return 'blog'
-        else:
-            return 'other'
+        
+        for page_type, pattern in self._page_type_patterns:
+            if pattern.search(url_lower):
+                return page_type
+        return 'other'
+    
+    def get_page_weight(self, url: str) -> float:
+        """Get business importance weight for a URL"""
+        return self.page_weights.get(self.classify_page_type(url), 2.0)
+    
+    @staticmethod
+    def _scale_impact(base_impact: int, page_weight: float) -> int:
+        """Apply business importance multiplier to a base issue impact"""
+        strategic_impact = base_impact * (page_weight / 2.5)  # Normalize around 2.5 average
+        return min(100, int(strategic_impact))
     
     def get_strategic_impact_score(self, issue_type: str, url: str) -> int:
         """Get strategic impact score considering page importance"""
-        base_impact = self.issue_severity.get(issue_type, 50)
         page_type = self.classify_page_type(url)
-        page_weight = self.page_weights.get(page_type, 2.0)
-        
-        # Apply business importance multiplier
-        strategic_impact = base_impact * (page_weight / 2.5)  # Normalize around 2.5 average
-        
-        return min(100, int(strategic_impact))
+        impact = self._impact_table.get((issue_type, page_type))
+        if impact is None:  # Issue type without a configured severity
+            impact = self._scale_impact(self.issue_severity.get(issue_type, 50), self.page_weights.get(page_type, 2.0))
+        return impact
 
 class TechnicalSEOAuditor:
+    # Responsible teams and the issue types they own (checked in this order)
+    TEAM_DEFINITIONS = {
+        'tech_team': {
+            'name': '🧑‍💻 TECH/DEV TEAM',
+            'description': 'Server, infrastructure, and technical implementation issues',
+            'issue_types': [
+                'HTTP Error', 'Slow Response Time', 'Large Page Size',
+                'Missing Canonical Tag', 'Invalid Canonical URL', 'Blocked by Robots Meta',
+                'Missing Structured Data', 'Missing Product Schema', 'Missing Organization Schema',
+                'Insufficient Internal Links', 'Excessive External Links',
+                'High Impressions Zero Clicks', 'High Traffic Page with Technical Issues',
+                'missing_canonical', 'crawlability', 'https_issues',
+                'server_errors', 'redirect_chains', 'broken_links'
+            ]
+        },
+        'marketing_team': {
+            'name': '📈 MARKETING TEAM', 
+            'description': 'Content optimization, meta tags, and SEO strategy',
+            'issue_types': [
+                'Missing Title Tag', 'Short Title Tag', 'Long Title Tag', 'Generic Title Tag',
+                'Duplicate Title Tags', 'Missing Meta Description', 'Short Meta Description',
+                'Long Meta Description', 'Duplicate Meta Descriptions', 'Missing H1 Tag',
+                'Multiple H1 Tags', 'Thin Content',
+                'High Impressions Low CTR', 'High Impressions Poor Position', 'High Value Page Opportunity',
+                'duplicate_content', 'keyword_optimization', 'thin_content', 'missing_schema'
+            ]
+        },
+        'design_team': {
+            'name': '🎨 DESIGN/UX TEAM',
+            'description': 'User experience, mobile design, and visual optimization',
+            'issue_types': [
+                'Images Without Alt Text', 'not_mobile_friendly', 'poor_ux',
+                'mobile_usability', 'touch_targets', 'viewport_issues',
+                'image_optimization', 'layout_issues'
+            ]
+        }
+    }
+    
     def __init__(self, config: Dict):
         """Initialize the technical SEO audit system"""
         self.config = config
         self.strategic_scorer = StrategicSEOScorer()
         
+        # Team routing: lowercased keywords for the substring fallback, and the
+        # resolved team for every known issue type
+        self._team_keywords = {
+            team: tuple(t.lower().replace('_', ' ') for t in data['issue_types'])
+            for team, data in self.TEAM_DEFINITIONS.items()
+        }
+        self._issue_type_to_team = {}
+        for issue_type in list(self.strategic_scorer.issue_severity) + [
+            t for data in self.TEAM_DEFINITIONS.values() for t in data['issue_types']
+        ]:
+            self._team_for_issue_type(issue_type)
+        
         # Initialize components
         if config.get('gsc_credentials_path'):
             self.gsc = GoogleSearchConsoleAPI(config['gsc_credentials_path'])
         else:
             self.gsc = None
             
+        # One pooled HTTP session shared by crawler, schema validator and PageSpeed
+        self.http_session = make_session()
+        
         self.crawler = WebCrawler(
             max_workers=config.get('max_crawl_workers', 5),
-            timeout=config.get('crawl_timeout', 30)
+            timeout=config.get('crawl_timeout', 30),
+            session=self.http_session
         )
         
-        self.schema_validator = SchemaValidator()
+        self.schema_validator = SchemaValidator(session=self.http_session)
         
         # Initialize PageSpeed Insights collector directly
-        self.pagespeed_collector = PageSpeedCollector(config['pagespeed_api_key'])
+        self.pagespeed_collector = PageSpeedCollector(config['pagespeed_api_key'], session=self.http_session)
         
         # BigQuery for storing audit results
         if config.get('bigquery'):
@@ -555,6 +894,35 @@ class TechnicalSEOAuditor:
         else:
             self.storage = None
             self.table_ref = None
+        
+        # Local cache for PageSpeed/schema results across audit runs
+        if config.get('cache'):
+            self.cache = AuditResultCache(
+                path=config['cache'].get('path', 'audit_cache.db'),
+                ttl_days=config['cache'].get('ttl_days', 7)
+            )
+        else:
+            self.cache = None
+    
+    def close(self) -> None:
+        """Release the result cache connection and the shared HTTP session"""
+        if self.cache:
+            self.cache.close()
+        self.http_session.close()
+    
+    def _cached_call(self, cache_key: Optional[str], fetch: Callable[..., Dict], *args) -> Dict:
+        """Return fetch(*args), served from / stored in the result cache when possible"""
+        if not self.cache or cache_key is None:
+            return fetch(*args)
+        
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        result = fetch(*args)
+        if 'error' not in result:  # Don't cache failures
+            self.cache.set(cache_key, result)
+        return result
     
     def run_comprehensive_audit(self, site_urls: List[str], urls_to_audit: List[str]) -> Dict:
         """Run comprehensive technical SEO audit"""
@@ -574,40 +942,101 @@ class TechnicalSEOAuditor:
         }
         
         # 1. Google Search Console Data (Multi-Domain)
+        # Nothing before issue analysis needs it, so it is fetched in the
+        # background while the crawl, PSI and schema steps run
+        gsc_executor = None
+        gsc_future = None
         if self.gsc:
             logger.info(f"Fetching Google Search Console data for {len(site_urls)} domains...")
-            audit_results['gsc_data'] = self.gsc.get_multi_domain_coverage(site_urls, days_back=30, top_pages_per_domain=10)
-        
-        # 2. Crawl Analysis
-        logger.info(f"Crawling {len(urls_to_audit)} URLs...")
-        with ThreadPoolExecutor(max_workers=self.crawler.max_workers) as executor:
-            future_to_url = {
-                executor.submit(self.crawler.crawl_url, url): url 
-                for url in urls_to_audit
+            gsc_executor = ThreadPoolExecutor(max_workers=1)
+            gsc_future = gsc_executor.submit(
+                self.gsc.get_multi_domain_coverage, site_urls, days_back=30, top_pages_per_domain=10
+            )
+        
+        try:
+            # 2. Crawl Analysis
+            # Schema validation is limited to the first 10 (deduplicated) URLs; their
+            # crawled bodies are kept so step 3 validates them without refetching
+            schema_urls = list(dict.fromkeys(urls_to_audit[:10]))
+            schema_url_set = set(schema_urls)
+            schema_page_content = {}
+            
+            logger.info(f"Crawling {len(urls_to_audit)} URLs...")
+            with ThreadPoolExecutor(max_workers=self.crawler.max_workers) as executor:
+                future_to_url = {
+                    executor.submit(self.crawler.crawl_url_with_content, url): url 
+                    for url in urls_to_audit
+                }
+                
+                for future in as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        crawl_result = future.result()
+                        if crawl_result:
+                            crawl_metrics, content = crawl_result
+                            audit_results['crawl_data'].append(crawl_metrics.to_dict())
+                            if url in schema_url_set:
+                                schema_page_content[url] = content
+                    except Exception as e:
+                        logger.error(f"Error crawling {url}: {e}")
+            
+            # Cache keys include a hash of the crawled body, so changed pages are re-fetched
+            content_hashes = {
+                url: hashlib.sha256(content).hexdigest()
+                for url, content in schema_page_content.items()
             }
             
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
+            # 3. PageSpeed Insights and Schema Validation
+            # Both only depend on the crawl, so they run side by side: schema
+            # validation overlaps the (much slower) PSI calls instead of waiting on them
+            logger.info("Fetching PageSpeed Insights data and validating structured data...")
+            pagespeed_jobs = [
+                (url, strategy)
+                for url in urls_to_audit[:5]  # Limit for API quota
+                for strategy in ['mobile', 'desktop']
+            ]
+            # PSI calls are slow and IO-bound; the pool size bounds our request rate
+            with ThreadPoolExecutor(max_workers=self.config.get('max_pagespeed_workers', 8)) as pagespeed_executor, \
+                 ThreadPoolExecutor(max_workers=self.crawler.max_workers) as schema_executor:
+                future_to_job = {
+                    pagespeed_executor.submit(
+                        self._cached_call,
+                        self._result_cache_key('pagespeed', url, strategy, content_hashes),
+                        self.pagespeed_collector.get_page_speed_data, url, strategy
+                    ): (url, strategy)
+                    for url, strategy in pagespeed_jobs
+                }
+                future_to_url = {
+                    schema_executor.submit(
+                        self._cached_call,
+                        self._result_cache_key('schema', url, None, content_hashes),
+                        self.schema_validator.validate_structured_data, url, schema_page_content.get(url)
+                    ): url
+                    for url in schema_urls
+                }
+                
+                for future in as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        audit_results['schema_data'].append(future.result())
+                    except Exception as e:
+                        logger.error(f"Error validating schema for {url}: {e}")
+                
+                for future in as_completed(future_to_job):
+                    url, strategy = future_to_job[future]
+                    try:
+                        audit_results['pagespeed_data'].append(future.result())
+                    except Exception as e:
+                        logger.error(f"Error fetching PageSpeed data for {url} ({strategy}): {e}")
+        finally:
+            # Collect the GSC fetch even if steps 2-3 fail, so its errors are
+            # logged rather than lost with an abandoned future
+            if gsc_future:
+                gsc_executor.shutdown()
                 try:
-                    crawl_result = future.result()
-                    if crawl_result:
-                        audit_results['crawl_data'].append(asdict(crawl_result))
+                    audit_results['gsc_data'] = gsc_future.result()
                 except Exception as e:
-                    logger.error(f"Error crawling {url}: {e}")
-        
-        # 3. PageSpeed Insights Analysis
-        logger.info("Fetching PageSpeed Insights data...")
-        for url in urls_to_audit[:5]:  # Limit for API quota
-            for strategy in ['mobile', 'desktop']:
-                pagespeed_result = self.pagespeed_collector.get_page_speed_data(url, strategy)
-                audit_results['pagespeed_data'].append(pagespeed_result)
-                time.sleep(1)  # Rate limiting
-        
-        # 4. Schema Validation
-        logger.info("Validating structured data...")
-        for url in urls_to_audit[:10]:  # Limit schema validation for performance
-            schema_result = self.schema_validator.validate_structured_data(url)
-            audit_results['schema_data'].append(schema_result)
+                    logger.error(f"Error fetching Google Search Console data: {e}")
         
         # 4. Issue Analysis
         audit_results['issues'] = self._analyze_issues(audit_results)
@@ -623,382 +1052,216 @@ class TechnicalSEOAuditor:
         
         return audit_results
     
+    @staticmethod
+    def _result_cache_key(kind: str, url: str, strategy: Optional[str], content_hashes: Dict[str, str]) -> Optional[str]:
+        """Cache key for a per-URL result; None (uncached) if the page body wasn't crawled"""
+        content_hash = content_hashes.get(url)
+        if content_hash is None:
+            return None
+        return AuditResultCache.make_key(kind, url, strategy, content_hash)
+    
     def _analyze_issues(self, audit_results: Dict) -> List[TechnicalSEOIssue]:
         """Analyze audit data to identify technical SEO issues"""
         issues = []
         current_time = datetime.now(timezone.utc)
         
+        # Impact depends only on (issue_type, url); score each pair once per run
+        impact_cache = {}
+        
+        def impact_score(issue_type: str, url: str) -> int:
+            key = (issue_type, url)
+            score = impact_cache.get(key)
+            if score is None:
+                score = impact_cache[key] = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
+            return score
+        
+        def emit(url: str, issue_type: str, severity: str, category: str, description: str, recommendation: str) -> None:
+            """Record a new issue, scored for its page (fields in TechnicalSEOIssue order)"""
+            issues.append(TechnicalSEOIssue(
+                url, issue_type, severity, category, description, recommendation,
+                current_time, 'New', impact_score(issue_type, url)
+            ))
+        
+        title_min, title_max = TITLE_LENGTH_RANGE
+        meta_min, meta_max = META_DESCRIPTION_LENGTH_RANGE
+        
         # Analyze crawl data for issues
         for crawl_data in audit_results['crawl_data']:
+            # Unpack the fields checked below once per page
             url = crawl_data['url']
+            status_code = crawl_data['status_code']
+            response_time = crawl_data['response_time']
+            title = crawl_data['title']
+            meta_description = crawl_data['meta_description']
+            h1_tags = crawl_data['h1_tags']
+            images_without_alt = crawl_data['images_without_alt']
+            page_size = crawl_data['page_size']
+            canonical_url = crawl_data['canonical_url']
+            internal_links = crawl_data['internal_links']
+            external_links = crawl_data['external_links']
+            robots_meta = crawl_data['robots_meta']
             
             # HTTP Status Issues
-            if crawl_data['status_code'] >= 400:
-                issue_type = 'HTTP Error'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='Critical' if crawl_data['status_code'] >= 500 else 'High',
-                    category='Crawlability',
-                    description=f"HTTP {crawl_data['status_code']} error",
-                    recommendation=f"Fix HTTP {crawl_data['status_code']} error to ensure page is accessible",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+            if status_code >= 400:
+                emit(url, 'HTTP Error', 'Critical' if status_code >= 500 else 'High', 'Crawlability',
+                     f"HTTP {status_code} error",
+                     f"Fix HTTP {status_code} error to ensure page is accessible")
             
             # Performance Issues
-            if crawl_data['response_time'] > 3.0:
-                issue_type = 'Slow Response Time'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='High' if crawl_data['response_time'] > 5.0 else 'Medium',
-                    category='Performance',
-                    description=f"Response time: {crawl_data['response_time']:.2f}s",
-                    recommendation="Optimize server response time to under 2 seconds",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+            if response_time > 3.0:
+                emit(url, 'Slow Response Time', 'High' if response_time > 5.0 else 'Medium', 'Performance',
+                     f"Response time: {response_time:.2f}s",
+                     "Optimize server response time to under 2 seconds")
             
             # Content Issues
-            if not crawl_data['title']:
-                issue_type = 'Missing Title Tag'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='High',
-                    category='Content',
-                    description="Page is missing title tag",
-                    recommendation="Add descriptive title tag (50-60 characters)",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
-            
-            if not crawl_data['meta_description']:
-                issue_type = 'Missing Meta Description'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='Medium',
-                    category='Content',
-                    description="Page is missing meta description",
-                    recommendation="Add compelling meta description (150-160 characters)",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+            if not title:
+                emit(url, 'Missing Title Tag', 'High', 'Content',
+                     "Page is missing title tag",
+                     "Add descriptive title tag (50-60 characters)")
+            
+            if not meta_description:
+                emit(url, 'Missing Meta Description', 'Medium', 'Content',
+                     "Page is missing meta description",
+                     "Add compelling meta description (150-160 characters)")
             
             # H1 Issues
-            if not crawl_data['h1_tags']:
-                issue_type = 'Missing H1 Tag'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='Medium',
-                    category='Content',
-                    description="Page is missing H1 tag",
-                    recommendation="Add descriptive H1 tag for page hierarchy",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
-            elif len(crawl_data['h1_tags']) > 1:
-                issue_type = 'Multiple H1 Tags'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='Low',
-                    category='Content',
-                    description=f"Page has {len(crawl_data['h1_tags'])} H1 tags",
-                    recommendation="Use only one H1 tag per page",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+            if not h1_tags:
+                emit(url, 'Missing H1 Tag', 'Medium', 'Content',
+                     "Page is missing H1 tag",
+                     "Add descriptive H1 tag for page hierarchy")
+            elif len(h1_tags) > 1:
+                emit(url, 'Multiple H1 Tags', 'Low', 'Content',
+                     f"Page has {len(h1_tags)} H1 tags",
+                     "Use only one H1 tag per page")
             
             # Image Issues
-            if crawl_data['images_without_alt'] > 0:
-                issue_type = 'Images Without Alt Text'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='Medium',
-                    category='Content',
-                    description=f"{crawl_data['images_without_alt']} images without alt text",
-                    recommendation="Add descriptive alt text to all images",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+            if images_without_alt > 0:
+                emit(url, 'Images Without Alt Text', 'Medium', 'Content',
+                     f"{images_without_alt} images without alt text",
+                     "Add descriptive alt text to all images")
             
             # Large Page Size
-            if crawl_data['page_size'] > 1024 * 1024:  # 1MB
-                issue_type = 'Large Page Size'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='Medium',
-                    category='Performance',
-                    description=f"Page size: {crawl_data['page_size'] / 1024 / 1024:.2f}MB",
-                    recommendation="Optimize images and resources to reduce page size",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+            if page_size > 1024 * 1024:  # 1MB
+                emit(url, 'Large Page Size', 'Medium', 'Performance',
+                     f"Page size: {page_size / 1024 / 1024:.2f}MB",
+                     "Optimize images and resources to reduce page size")
             
             # CONTENT QUALITY ANALYSIS
             
             # Thin Content Detection
-            content_length = len(crawl_data.get('title', '') + crawl_data.get('meta_description', '') + ' '.join(crawl_data.get('h1_tags', [])))
+            # Length of title + meta + space-joined H1s, without building the string
+            content_length = len(title) + len(meta_description)
+            if h1_tags:
+                content_length += sum(map(len, h1_tags)) + len(h1_tags) - 1
             if content_length < 200:  # Very basic content length check
-                issue_type = 'Thin Content'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='High',
-                    category='Content',
-                    description=f"Insufficient content detected (estimated {content_length} characters)",
-                    recommendation="Add substantial, valuable content with at least 300+ words",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+                emit(url, 'Thin Content', 'High', 'Content',
+                     f"Insufficient content detected (estimated {content_length} characters)",
+                     "Add substantial, valuable content with at least 300+ words")
             
             # Title Tag Quality Issues
-            if crawl_data['title']:
-                title_len = len(crawl_data['title'])
+            if title:
+                title_len = len(title)
                 
                 # Title too short
-                if title_len < 30:
-                    issue_type = 'Short Title Tag'
-                    strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                    issues.append(TechnicalSEOIssue(
-                        url=url,
-                        issue_type=issue_type,
-                        severity='Medium',
-                        category='Content',
-                        description=f"Title tag too short ({title_len} characters)",
-                        recommendation="Expand title to 50-60 characters with descriptive keywords",
-                        date_detected=current_time,
-                        status='New',
-                        impact_score=strategic_impact
-                    ))
+                if title_len < title_min:
+                    emit(url, 'Short Title Tag', 'Medium', 'Content',
+                         f"Title tag too short ({title_len} characters)",
+                         "Expand title to 50-60 characters with descriptive keywords")
                 
                 # Title too long  
-                elif title_len > 70:
-                    issue_type = 'Long Title Tag'
-                    strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                    issues.append(TechnicalSEOIssue(
-                        url=url,
-                        issue_type=issue_type,
-                        severity='Medium',
-                        category='Content',
-                        description=f"Title tag too long ({title_len} characters)",
-                        recommendation="Shorten title to 50-60 characters to avoid truncation",
-                        date_detected=current_time,
-                        status='New',
-                        impact_score=strategic_impact
-                    ))
+                elif title_len > title_max:
+                    emit(url, 'Long Title Tag', 'Medium', 'Content',
+                         f"Title tag too long ({title_len} characters)",
+                         "Shorten title to 50-60 characters to avoid truncation")
                 
                 # Generic/Non-descriptive titles
-                generic_patterns = ['untitled', 'new page', 'home page', 'welcome', 'default', 'page']
-                if any(pattern in crawl_data['title'].lower() for pattern in generic_patterns):
-                    issue_type = 'Generic Title Tag'
-                    strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                    issues.append(TechnicalSEOIssue(
-                        url=url,
-                        issue_type=issue_type,
-                        severity='High',
-                        category='Content',
-                        description=f"Generic/non-descriptive title: '{crawl_data['title']}'",
-                        recommendation="Create unique, descriptive title with target keywords",
-                        date_detected=current_time,
-                        status='New',
-                        impact_score=strategic_impact
-                    ))
+                if GENERIC_TITLE_PATTERN.search(title.lower()):
+                    emit(url, 'Generic Title Tag', 'High', 'Content',
+                         f"Generic/non-descriptive title: '{title}'",
+                         "Create unique, descriptive title with target keywords")
             
             # Meta Description Quality Issues
-            if crawl_data['meta_description']:
-                meta_len = len(crawl_data['meta_description'])
+            if meta_description:
+                meta_len = len(meta_description)
                 
                 # Meta description too short
-                if meta_len < 120:
-                    issue_type = 'Short Meta Description'
-                    strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                    issues.append(TechnicalSEOIssue(
-                        url=url,
-                        issue_type=issue_type,
-                        severity='Low',
-                        category='Content',
-                        description=f"Meta description too short ({meta_len} characters)",
-                        recommendation="Expand meta description to 150-160 characters",
-                        date_detected=current_time,
-                        status='New',
-                        impact_score=strategic_impact
-                    ))
+                if meta_len < meta_min:
+                    emit(url, 'Short Meta Description', 'Low', 'Content',
+                         f"Meta description too short ({meta_len} characters)",
+                         "Expand meta description to 150-160 characters")
                 
                 # Meta description too long
-                elif meta_len > 170:
-                    issue_type = 'Long Meta Description'
-                    strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                    issues.append(TechnicalSEOIssue(
-                        url=url,
-                        issue_type=issue_type,
-                        severity='Low',
-                        category='Content',
-                        description=f"Meta description too long ({meta_len} characters)",
-                        recommendation="Shorten meta description to 150-160 characters",
-                        date_detected=current_time,
-                        status='New',
-                        impact_score=strategic_impact
-                    ))
+                elif meta_len > meta_max:
+                    emit(url, 'Long Meta Description', 'Low', 'Content',
+                         f"Meta description too long ({meta_len} characters)",
+                         "Shorten meta description to 150-160 characters")
             
             # ADVANCED SEO FACTORS
             
             # Missing or Invalid Canonical URL
-            if not crawl_data['canonical_url']:
-                issue_type = 'Missing Canonical Tag'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='High',
-                    category='Technical SEO',
-                    description="Page missing canonical URL tag",
-                    recommendation="Add rel='canonical' tag to prevent duplicate content issues",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
-            elif crawl_data['canonical_url'] != url and not crawl_data['canonical_url'].startswith('http'):
-                issue_type = 'Invalid Canonical URL'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='High',
-                    category='Technical SEO',
-                    description=f"Invalid canonical URL: {crawl_data['canonical_url']}",
-                    recommendation="Fix canonical URL to be absolute and valid",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+            if not canonical_url:
+                emit(url, 'Missing Canonical Tag', 'High', 'Technical SEO',
+                     "Page missing canonical URL tag",
+                     "Add rel='canonical' tag to prevent duplicate content issues")
+            elif canonical_url != url and not canonical_url.startswith('http'):
+                emit(url, 'Invalid Canonical URL', 'High', 'Technical SEO',
+                     f"Invalid canonical URL: {canonical_url}",
+                     "Fix canonical URL to be absolute and valid")
             
             # Poor Internal Linking Structure
-            if crawl_data['internal_links'] < 3:
-                issue_type = 'Insufficient Internal Links'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='Medium',
-                    category='Technical SEO',
-                    description=f"Only {crawl_data['internal_links']} internal links found",
-                    recommendation="Add more contextual internal links to improve site navigation and SEO",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+            if internal_links < 3:
+                emit(url, 'Insufficient Internal Links', 'Medium', 'Technical SEO',
+                     f"Only {internal_links} internal links found",
+                     "Add more contextual internal links to improve site navigation and SEO")
             
             # Excessive External Links
-            if crawl_data['external_links'] > 50:
-                issue_type = 'Excessive External Links'
-                strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                issues.append(TechnicalSEOIssue(
-                    url=url,
-                    issue_type=issue_type,
-                    severity='Low',
-                    category='Technical SEO',
-                    description=f"{crawl_data['external_links']} external links found",
-                    recommendation="Review external links and consider nofollow for non-essential links",
-                    date_detected=current_time,
-                    status='New',
-                    impact_score=strategic_impact
-                ))
+            if external_links > 50:
+                emit(url, 'Excessive External Links', 'Low', 'Technical SEO',
+                     f"{external_links} external links found",
+                     "Review external links and consider nofollow for non-essential links")
             
             # Missing or Problematic Robots Meta Tag
-            if crawl_data['robots_meta']:
-                robots_content = crawl_data['robots_meta'].lower()
+            if robots_meta:
+                robots_content = robots_meta.lower()
                 if 'noindex' in robots_content and 'nofollow' in robots_content:
-                    issue_type = 'Blocked by Robots Meta'
-                    strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                    issues.append(TechnicalSEOIssue(
-                        url=url,
-                        issue_type=issue_type,
-                        severity='Critical',
-                        category='Technical SEO',
-                        description=f"Page blocked by robots meta: {crawl_data['robots_meta']}",
-                        recommendation="Remove noindex/nofollow if page should be indexed",
-                        date_detected=current_time,
-                        status='New',
-                        impact_score=strategic_impact
-                    ))
+                    emit(url, 'Blocked by Robots Meta', 'Critical', 'Technical SEO',
+                         f"Page blocked by robots meta: {robots_meta}",
+                         "Remove noindex/nofollow if page should be indexed")
         
         # CROSS-PAGE ANALYSIS (Duplicate Content Detection)
         
-        # Collect titles and meta descriptions for duplicate detection
-        titles_seen = {}
-        meta_descriptions_seen = {}
+        # Group URLs by title and meta description for duplicate detection
+        urls_by_title = defaultdict(list)
+        urls_by_meta_description = defaultdict(list)
         
         for crawl_data in audit_results['crawl_data']:
             url = crawl_data['url']
-            title = crawl_data.get('title', '').strip()
-            meta_desc = crawl_data.get('meta_description', '').strip()
-            
-            # Track duplicate titles
-            if title and len(title) > 10:  # Ignore very short titles
-                if title in titles_seen:
-                    # Both current and previously seen URL have duplicate titles
-                    for duplicate_url in [url, titles_seen[title]]:
-                        issue_type = 'Duplicate Title Tags'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, duplicate_url)
-                        issues.append(TechnicalSEOIssue(
-                            url=duplicate_url,
-                            issue_type=issue_type,
-                            severity='High',
-                            category='Content',
-                            description=f"Duplicate title tag: '{title}' (also found on other pages)",
-                            recommendation="Create unique title tags for each page",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
-                else:
-                    titles_seen[title] = url
-            
-            # Track duplicate meta descriptions
-            if meta_desc and len(meta_desc) > 20:  # Ignore very short descriptions
-                if meta_desc in meta_descriptions_seen:
-                    # Both current and previously seen URL have duplicate meta descriptions
-                    for duplicate_url in [url, meta_descriptions_seen[meta_desc]]:
-                        issue_type = 'Duplicate Meta Descriptions'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, duplicate_url)
-                        issues.append(TechnicalSEOIssue(
-                            url=duplicate_url,
-                            issue_type=issue_type,
-                            severity='Medium',
-                            category='Content',
-                            description=f"Duplicate meta description (also found on other pages)",
-                            recommendation="Create unique meta descriptions for each page",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
-                else:
-                    meta_descriptions_seen[meta_desc] = url
+            title = _stripped_if_longer(crawl_data.get('title'), 10)  # Ignore very short titles
+            meta_desc = _stripped_if_longer(crawl_data.get('meta_description'), 20)  # Ignore very short descriptions
+            
+            if title:
+                urls_by_title[title].append(url)
+            
+            if meta_desc:
+                urls_by_meta_description[meta_desc].append(url)
+        
+        # One issue per page sharing a title with at least one other page
+        for title, duplicate_urls in urls_by_title.items():
+            if len(duplicate_urls) < 2:
+                continue
+            for duplicate_url in duplicate_urls:
+                emit(duplicate_url, 'Duplicate Title Tags', 'High', 'Content',
+                     f"Duplicate title tag: '{title}' (also found on other pages)",
+                     "Create unique title tags for each page")
+        
+        # One issue per page sharing a meta description with at least one other page
+        for duplicate_urls in urls_by_meta_description.values():
+            if len(duplicate_urls) < 2:
+                continue
+            for duplicate_url in duplicate_urls:
+                emit(duplicate_url, 'Duplicate Meta Descriptions', 'Medium', 'Content',
+                     f"Duplicate meta description (also found on other pages)",
+                     "Create unique meta descriptions for each page")
         
         # SCHEMA AND STRUCTURED DATA ANALYSIS
         if audit_results.get('schema_data'):
@@ -1010,54 +1273,31 @@ class TechnicalSEOAuditor:
                     
                     # Missing structured data
                     if json_ld_count == 0:
-                        issue_type = 'Missing Structured Data'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                        issues.append(TechnicalSEOIssue(
-                            url=url,
-                            issue_type=issue_type,
-                            severity='Medium',
-                            category='Technical SEO',
-                            description="No JSON-LD structured data found",
-                            recommendation="Add relevant schema markup (Organization, Product, etc.)",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
+                        emit(url, 'Missing Structured Data', 'Medium', 'Technical SEO',
+                             "No JSON-LD structured data found",
+                             "Add relevant schema markup (Organization, Product, etc.)")
                     
                     # Missing important schema types for e-commerce
                     page_type = self.strategic_scorer.classify_page_type(url)
                     if page_type == 'product' and 'Product' not in schema_types:
-                        issue_type = 'Missing Product Schema'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                        issues.append(TechnicalSEOIssue(
-                            url=url,
-                            issue_type=issue_type,
-                            severity='High',
-                            category='Technical SEO',
-                            description="Product page missing Product schema markup",
-                            recommendation="Add Product schema with price, availability, and reviews",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
+                        emit(url, 'Missing Product Schema', 'High', 'Technical SEO',
+                             "Product page missing Product schema markup",
+                             "Add Product schema with price, availability, and reviews")
                     
                     if page_type == 'homepage' and 'Organization' not in schema_types:
-                        issue_type = 'Missing Organization Schema'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score(issue_type, url)
-                        issues.append(TechnicalSEOIssue(
-                            url=url,
-                            issue_type=issue_type,
-                            severity='Medium',
-                            category='Technical SEO',
-                            description="Homepage missing Organization schema markup",
-                            recommendation="Add Organization schema with company information",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
+                        emit(url, 'Missing Organization Schema', 'Medium', 'Technical SEO',
+                             "Homepage missing Organization schema markup",
+                             "Add Organization schema with company information")
         
         # GSC-SPECIFIC ISSUE ANALYSIS (Top Impression Pages)
         if audit_results.get('gsc_data'):
+            # Non-GSC issues by URL for the cross-reference below; the loop only
+            # adds 'GSC Performance' issues, so the index stays complete
+            crawl_issues_by_url = defaultdict(list)
+            for issue in issues:
+                if issue.category != 'GSC Performance':
+                    crawl_issues_by_url[issue.url].append(issue)
+            
             for domain, gsc_metrics_list in audit_results['gsc_data'].items():
                 for gsc_metric in gsc_metrics_list:
                     url = gsc_metric.url
@@ -1070,184 +1310,118 @@ class TechnicalSEOAuditor:
                     
                     # High impression page with poor CTR
                     if impressions > 1000 and ctr < 0.02:  # Less than 2% CTR
-                        issue_type = 'High Impressions Low CTR'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score('High Impressions Low CTR', url)
-                        issues.append(TechnicalSEOIssue(
-                            url=url,
-                            issue_type=issue_type,
-                            severity='High',
-                            category='GSC Performance',
-                            description=f"Top page ({impressions:,} impressions) has low CTR ({ctr:.2%}) in {domain_name}",
-                            recommendation="Improve title tag and meta description to increase click-through rate",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
+                        emit(url, 'High Impressions Low CTR', 'High', 'GSC Performance',
+                             f"Top page ({impressions:,} impressions) has low CTR ({ctr:.2%}) in {domain_name}",
+                             "Improve title tag and meta description to increase click-through rate")
                     
                     # High impression page with poor ranking position
                     if impressions > 500 and position > 10:  # Not in top 10
-                        issue_type = 'High Impressions Poor Position'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score('High Impressions Poor Position', url)
-                        issues.append(TechnicalSEOIssue(
-                            url=url,
-                            issue_type=issue_type,
-                            severity='Medium',
-                            category='GSC Performance',
-                            description=f"Page with {impressions:,} impressions ranking at position {position:.1f} in {domain_name}",
-                            recommendation="Optimize content and technical SEO to improve ranking position",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
+                        emit(url, 'High Impressions Poor Position', 'Medium', 'GSC Performance',
+                             f"Page with {impressions:,} impressions ranking at position {position:.1f} in {domain_name}",
+                             "Optimize content and technical SEO to improve ranking position")
                     
                     # Top impression page with zero clicks
                     if impressions > 1000 and clicks == 0:
-                        issue_type = 'High Impressions Zero Clicks'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score('High Impressions Zero Clicks', url)
-                        issues.append(TechnicalSEOIssue(
-                            url=url,
-                            issue_type=issue_type,
-                            severity='Critical',
-                            category='GSC Performance',
-                            description=f"Top visibility page ({impressions:,} impressions) getting zero clicks in {domain_name}",
-                            recommendation="Urgent: Review title/meta tags - page visible but not clickable",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
+                        emit(url, 'High Impressions Zero Clicks', 'Critical', 'GSC Performance',
+                             f"Top visibility page ({impressions:,} impressions) getting zero clicks in {domain_name}",
+                             "Urgent: Review title/meta tags - page visible but not clickable")
                     
                     # Very high impression page - opportunity alert
                     if impressions > 10000:
-                        issue_type = 'High Value Page Opportunity'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score('High Value Page Opportunity', url)
-                        issues.append(TechnicalSEOIssue(
-                            url=url,
-                            issue_type=issue_type,
-                            severity='Medium',
-                            category='GSC Performance',
-                            description=f"High-value page ({impressions:,} impressions, {clicks} clicks) in {domain_name}",
-                            recommendation="Prioritize optimization - this page has significant traffic potential",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
+                        emit(url, 'High Value Page Opportunity', 'Medium', 'GSC Performance',
+                             f"High-value page ({impressions:,} impressions, {clicks} clicks) in {domain_name}",
+                             "Prioritize optimization - this page has significant traffic potential")
                     
                     # Cross-reference GSC data with crawl issues
-                    crawl_issues_for_url = [issue for issue in issues if issue.url == url and issue.category != 'GSC Performance']
+                    crawl_issues_for_url = crawl_issues_by_url.get(url, [])
                     if crawl_issues_for_url and impressions > 1000:
-                        issue_type = 'High Traffic Page with Technical Issues'
-                        strategic_impact = self.strategic_scorer.get_strategic_impact_score('High Traffic Page with Technical Issues', url)
                         technical_issues = ', '.join([issue.issue_type for issue in crawl_issues_for_url[:3]])
-                        issues.append(TechnicalSEOIssue(
-                            url=url,
-                            issue_type=issue_type,
-                            severity='Critical',
-                            category='GSC Performance',
-                            description=f"High-impression page ({impressions:,}) has technical issues: {technical_issues} in {domain_name}",
-                            recommendation="URGENT: Fix technical issues on high-traffic page to prevent ranking loss",
-                            date_detected=current_time,
-                            status='New',
-                            impact_score=strategic_impact
-                        ))
+                        emit(url, 'High Traffic Page with Technical Issues', 'Critical', 'GSC Performance',
+                             f"High-impression page ({impressions:,}) has technical issues: {technical_issues} in {domain_name}",
+                             "URGENT: Fix technical issues on high-traffic page to prevent ranking loss")
         
         return issues
     
-    def _categorize_issues_by_team(self, issues: List[TechnicalSEOIssue]) -> Dict:
-        """Categorize issues by responsible team"""
-        team_categories = {
-            'tech_team': {
-                'name': '🧑‍💻 TECH/DEV TEAM',
-                'description': 'Server, infrastructure, and technical implementation issues',
-                'issues': [],
-                'issue_types': [
-                    'HTTP Error', 'Slow Response Time', 'Large Page Size',
-                    'Missing Canonical Tag', 'Invalid Canonical URL', 'Blocked by Robots Meta',
-                    'Missing Structured Data', 'Missing Product Schema', 'Missing Organization Schema',
-                    'Insufficient Internal Links', 'Excessive External Links',
-                    'High Impressions Zero Clicks', 'High Traffic Page with Technical Issues',
-                    'missing_canonical', 'crawlability', 'https_issues',
-                    'server_errors', 'redirect_chains', 'broken_links'
-                ]
-            },
-            'marketing_team': {
-                'name': '📈 MARKETING TEAM', 
-                'description': 'Content optimization, meta tags, and SEO strategy',
-                'issues': [],
-                'issue_types': [
-                    'Missing Title Tag', 'Short Title Tag', 'Long Title Tag', 'Generic Title Tag',
-                    'Duplicate Title Tags', 'Missing Meta Description', 'Short Meta Description',
-                    'Long Meta Description', 'Duplicate Meta Descriptions', 'Missing H1 Tag',
-                    'Multiple H1 Tags', 'Thin Content',
-                    'High Impressions Low CTR', 'High Impressions Poor Position', 'High Value Page Opportunity',
-                    'duplicate_content', 'keyword_optimization', 'thin_content', 'missing_schema'
-                ]
-            },
-            'design_team': {
-                'name': '🎨 DESIGN/UX TEAM',
-                'description': 'User experience, mobile design, and visual optimization',
+    def _team_for_issue_type(self, issue_type: str) -> str:
+        """Resolve the responsible team for an issue type (cached per type)"""
+        team = self._issue_type_to_team.get(issue_type)
+        if team is None:
+            team = self._issue_type_to_team[issue_type] = self._match_team(issue_type)
+        return team
+    
+    def _match_team(self, issue_type: str) -> str:
+        """First team listing the type, or with a keyword contained in it; tech team by default"""
+        issue_lc = issue_type.lower()
+        for team, data in self.TEAM_DEFINITIONS.items():
+            if issue_type in data['issue_types'] or \
+               any(keyword in issue_lc for keyword in self._team_keywords[team]):
+                return team
+        return 'tech_team'
+    
+    def _new_team_categories(self) -> Dict:
+        """Empty per-team issue buckets, one per entry in TEAM_DEFINITIONS"""
+        return {
+            team: {
+                'name': data['name'],
+                'description': data['description'],
                 'issues': [],
-                'issue_types': [
-                    'Images Without Alt Text', 'not_mobile_friendly', 'poor_ux',
-                    'mobile_usability', 'touch_targets', 'viewport_issues',
-                    'image_optimization', 'layout_issues'
-                ]
+                'issue_types': list(data['issue_types'])
             }
+            for team, data in self.TEAM_DEFINITIONS.items()
+        }
+    
+    @staticmethod
+    def _compute_team_metrics(team_issues: List[TechnicalSEOIssue]) -> Dict:
+        """Compute severity counts, average impact and priority for one team"""
+        critical = high = 0
+        total_impact = 0
+        for i in team_issues:
+            total_impact += i.impact_score
+            if i.severity == 'Critical':
+                critical += 1
+            elif i.severity == 'High':
+                high += 1
+        return {
+            'total_issues': len(team_issues),
+            'critical_issues': critical,
+            'high_issues': high,
+            'avg_impact': total_impact / len(team_issues) if team_issues else 0,
+            'priority_score': critical * 10 + high * 5 + len(team_issues)
         }
-        
-        # Categorize each issue
-        for issue in issues:
-            issue_type = issue.issue_type
-            categorized = False
-            
-            for team, data in team_categories.items():
-                if issue_type in data['issue_types'] or \
-                   any(keyword in issue_type.lower() for keyword in [t.lower().replace('_', ' ') for t in data['issue_types']]):
-                    data['issues'].append(issue)
-                    categorized = True
-                    break
-            
-            # Default to tech team for uncategorized issues
-            if not categorized:
-                team_categories['tech_team']['issues'].append(issue)
-        
-        # Calculate team metrics
-        for team, data in team_categories.items():
-            team_issues = data['issues']
-            data['total_issues'] = len(team_issues)
-            data['critical_issues'] = len([i for i in team_issues if i.severity == 'Critical'])
-            data['high_issues'] = len([i for i in team_issues if i.severity == 'High'])
-            data['avg_impact'] = sum(i.impact_score for i in team_issues) / len(team_issues) if team_issues else 0
-            data['priority_score'] = data['critical_issues'] * 10 + data['high_issues'] * 5 + len(team_issues)
-        
-        return team_categories
     
     def _generate_audit_summary(self, audit_results: Dict) -> Dict:
         """Generate audit summary statistics"""
         issues = audit_results['issues']
         crawl_data = audit_results['crawl_data']
         
-        # Categorize issues by team
-        team_breakdown = self._categorize_issues_by_team(issues)
+        # Severity and category counts, per-page grouping and team categorization,
+        # in one pass over the issues
+        severity_counts = Counter()
+        category_counts = Counter()
+        page_issues = defaultdict(list)
+        team_breakdown = self._new_team_categories()
+        for issue in issues:
+            severity_counts[issue.severity] += 1
+            category_counts[issue.category] += 1
+            page_issues[issue.url].append(issue)
+            team_breakdown[self._team_for_issue_type(issue.issue_type)]['issues'].append(issue)
+        
+        # Calculate team metrics
+        for data in team_breakdown.values():
+            data.update(self._compute_team_metrics(data['issues']))
         
         summary = {
             'total_issues': len(issues),
-            'critical_issues': len([i for i in issues if i.severity == 'Critical']),
-            'high_issues': len([i for i in issues if i.severity == 'High']),
-            'medium_issues': len([i for i in issues if i.severity == 'Medium']),
-            'low_issues': len([i for i in issues if i.severity == 'Low']),
-            'issue_categories': {},
+            'critical_issues': severity_counts['Critical'],
+            'high_issues': severity_counts['High'],
+            'medium_issues': severity_counts['Medium'],
+            'low_issues': severity_counts['Low'],
+            'issue_categories': dict(category_counts),
             'avg_response_time': 0,
             'error_pages': 0,
             'seo_score': 0
         }
         
-        # Category breakdown
-        for issue in issues:
-            category = issue.category
-            if category not in summary['issue_categories']:
-                summary['issue_categories'][category] = 0
-            summary['issue_categories'][category] += 1
-        
         # Performance metrics
         if crawl_data:
             summary['avg_response_time'] = sum(c['response_time'] for c in crawl_data) / len(crawl_data)
@@ -1256,35 +1430,26 @@ class TechnicalSEOAuditor:
         # Calculate Strategic SEO Score
         total_weighted_impact = 0
         total_weight = 0
-        
-        # Group issues by URL for page-level scoring
-        page_issues = {}
-        for issue in issues:
-            if issue.url not in page_issues:
-                page_issues[issue.url] = []
-            page_issues[issue.url].append(issue)
+        get_page_weight = self.strategic_scorer.get_page_weight
         
         # Calculate weighted impact per page
         for url, url_issues in page_issues.items():
-            page_type = self.strategic_scorer.classify_page_type(url)
-            page_weight = self.strategic_scorer.page_weights.get(page_type, 2.0)
+            page_weight = get_page_weight(url)
             
             # Sum impact for this page
-            page_impact = sum(issue.impact_score for issue in url_issues)
+            page_impact = 0
+            for issue in url_issues:
+                page_impact += issue.impact_score
             
             # Weight by business importance
-            weighted_impact = page_impact * page_weight
-            total_weighted_impact += weighted_impact
+            total_weighted_impact += page_impact * page_weight
             total_weight += page_weight
         
-        # Include pages with no issues
-        crawl_data = audit_results.get('crawl_data', [])
-        for page_data in crawl_data:
-            url = page_data['url']
+        # Include pages with no issues (they add weight but no impact), in one
+        # pass over the crawled URLs
+        for url in map(operator.itemgetter('url'), crawl_data):
             if url not in page_issues:
-                page_type = self.strategic_scorer.classify_page_type(url)
-                page_weight = self.strategic_scorer.page_weights.get(page_type, 2.0)
-                total_weight += page_weight
+                total_weight += get_page_weight(url)
         
         if total_weight > 0:
             # Calculate strategic score
@@ -1306,35 +1471,38 @@ class TechnicalSEOAuditor:
         """Generate strategic insights about SEO health"""
         insights = {
             'high_priority_pages_with_issues': 0,
-            'page_type_breakdown': {},
+            'page_type_breakdown': defaultdict(lambda: {'pages': 0, 'issues': 0}),
             'critical_business_impact': []
         }
         
+        classify_page_type = self.strategic_scorer.classify_page_type
+        page_weights = self.strategic_scorer.page_weights
+        
         # Analyze high-priority pages
         for url, issues in page_issues.items():
-            page_type = self.strategic_scorer.classify_page_type(url)
-            page_weight = self.strategic_scorer.page_weights.get(page_type, 2.0)
+            page_type = classify_page_type(url)
+            page_weight = page_weights.get(page_type, 2.0)
             
             # Count high-priority pages with issues
             if page_weight >= 4.0:  # Homepage, product, checkout pages
                 insights['high_priority_pages_with_issues'] += 1
                 
                 # Critical issues on important pages
-                critical_issues = [issue for issue in issues if issue.severity == 'Critical']
-                if critical_issues:
+                critical_count = sum(1 for issue in issues if issue.severity == 'Critical')
+                if critical_count:
                     insights['critical_business_impact'].append({
                         'url': url,
                         'page_type': page_type,
-                        'critical_issues': len(critical_issues),
+                        'critical_issues': critical_count,
                         'business_importance': page_weight
                     })
             
             # Page type breakdown
-            if page_type not in insights['page_type_breakdown']:
-                insights['page_type_breakdown'][page_type] = {'pages': 0, 'issues': 0}
-            insights['page_type_breakdown'][page_type]['pages'] += 1
-            insights['page_type_breakdown'][page_type]['issues'] += len(issues)
+            breakdown = insights['page_type_breakdown'][page_type]
+            breakdown['pages'] += 1
+            breakdown['issues'] += len(issues)
         
+        insights['page_type_breakdown'] = dict(insights['page_type_breakdown'])
         return insights
     
     def get_urls_to_audit_from_bigquery(self, domains: List[str] = None, limit: int = 100) -> List[str]:
@@ -1356,20 +1524,22 @@ class TechnicalSEOAuditor:
             ]
             
         try:
-            # Create WHERE condition for multiple domains
-            domain_conditions = " OR ".join([f"canonicalURL LIKE '%{domain}%'" for domain in domains])
-            
-            # Query to get URLs from your specific CanonicalURLMapping table using correct schema
-            query = f"""
+            # Query to get URLs from your specific CanonicalURLMapping table using correct schema;
+            # match the registered domain exactly (covers www./subdomains) instead of LIKE scans
+            query = """
             SELECT DISTINCT canonicalURL as url
             FROM `printerpix-general.GA_Avanish.CanonicalURLMapping`
             WHERE canonicalURL IS NOT NULL
-                AND ({domain_conditions})
-            LIMIT {limit}
+                AND NET.REG_DOMAIN(canonicalURL) IN UNNEST(@domains)
+            LIMIT @limit
             """
+            job_config = bigquery.QueryJobConfig(query_parameters=[
+                bigquery.ArrayQueryParameter('domains', 'STRING', domains),
+                bigquery.ScalarQueryParameter('limit', 'INT64', limit)
+            ])
             
-            print(f"DEBUG: Executing BigQuery: {query}")
-            query_job = self.storage.query(query)
+            print(f"DEBUG: Executing BigQuery: {query} (domains={domains}, limit={limit})")
+            query_job = self.storage.query(query, job_config=job_config)
             results = query_job.result()
             
             urls = [row.url for row in results if row.url]
@@ -1396,7 +1566,7 @@ class TechnicalSEOAuditor:
     
     def _store_audit_results(self, audit_results: Dict) -> None:
         """Store audit results in BigQuery"""
-        if not hasattr(self, 'storage'):
+        if not self.storage:
             return
         
         try:
@@ -1418,19 +1588,22 @@ class TechnicalSEOAuditor:
             
             if issues_data:
                 df = pd.DataFrame(issues_data)
-                df.to_gbq(
+                # Single batch load job (Parquet upload) rather than streaming rows
+                load_job = self.storage.load_table_from_dataframe(
+                    df,
                     self.table_ref,
-                    project_id=self.config['bigquery']['project_id'],
-                    if_exists='append'
+                    job_config=bigquery.LoadJobConfig(write_disposition='WRITE_APPEND')
                 )
+                load_job.result()  # Wait for the load to finish so failures surface here
                 logger.info(f"Stored {len(issues_data)} issues in BigQuery")
                 
         except Exception as e:
             logger.error(f"Error storing audit results: {e}")
 
 # Configuration and usage
+@functools.lru_cache(maxsize=1)
 def load_audit_config() -> Dict:
-    """Load audit configuration from environment variables"""
+    """Load audit configuration from environment variables (read once per process)"""
     # Get API keys from environment variables
     pagespeed_api_key = os.getenv('PAGESPEED_API_KEY')
     gsc_credentials_path = os.getenv('GSC_CREDENTIALS_PATH')
@@ -1448,12 +1621,17 @@ def load_audit_config() -> Dict:
         'gsc_credentials_path': gsc_credentials_path,
         'pagespeed_api_key': pagespeed_api_key,
         'bigquery': {
-            'project_id': 'printerpix-general',
-            'dataset_id': 'GA_CG',
+            'project_id': os.getenv('BIGQUERY_PROJECT_ID', 'printerpix-general'),
+            'dataset_id': os.getenv('BIGQUERY_DATASET_ID', 'GA_CG'),
             'credentials_path': bigquery_credentials_path
         },
         'max_crawl_workers': 5,
+        'max_pagespeed_workers': 8,
         'crawl_timeout': 30,
+        'cache': {
+            'path': os.getenv('AUDIT_CACHE_PATH', 'audit_cache.db'),
+            'ttl_days': 7
+        },
         'audit_schedule': 'weekly'  # daily, weekly, monthly
     }
 
@@ -1471,13 +1649,11 @@ if __name__ == "__main__":
     print(f"DEBUG: First 5 URLs: {urls_to_audit[:5]}")
     
     # Group URLs by domain for summary
-    domain_counts = {}
-    for url in urls_to_audit:
-        for domain in ['printerpix.com', 'printerpix.co.uk', 'printerpix.fr', 'printerpix.it', 'printerpix.nl', 'printerpix.es', 'printerpix.de']:
-            if domain in url:
-                domain_counts[domain] = domain_counts.get(domain, 0) + 1
-                break
-    print(f"DEBUG: URLs per domain: {domain_counts}")
+    domain_pattern = re.compile(r'printerpix\.(?:com|co\.uk|fr|it|nl|es|de)')
+    domain_counts = Counter(
+        match.group(0) for match in map(domain_pattern.search, urls_to_audit) if match
+    )
+    print(f"DEBUG: URLs per domain: {dict(domain_counts)}")
     
     # Run comprehensive audit for all GSC domain properties
     gsc_properties = [
@@ -1491,53 +1667,53 @@ if __name__ == "__main__":
     ]
     
     print(f"DEBUG: GSC properties to query: {gsc_properties}")
-    results = auditor.run_comprehensive_audit(gsc_properties, urls_to_audit)
+    try:
+        results = auditor.run_comprehensive_audit(gsc_properties, urls_to_audit)
+    finally:
+        auditor.close()
     
     # Save results to file
     # Enhanced JSON export with team-specific sections
-    enhanced_results = results.copy()
-    
-    # Add team-specific issue exports
+    # Team-specific issue exports
     team_breakdown = results['summary'].get('team_breakdown', {})
-    enhanced_results['team_exports'] = {}
-    
-    for team_key, team_data in team_breakdown.items():
-        if team_data['total_issues'] > 0:
-            enhanced_results['team_exports'][team_key] = {
-                'team_name': team_data['name'],
-                'description': team_data['description'],
-                'summary': {
-                    'total_issues': team_data['total_issues'],
-                    'critical_issues': team_data['critical_issues'],
-                    'high_issues': team_data['high_issues'],
-                    'priority_score': team_data['priority_score'],
-                    'avg_impact': team_data['avg_impact']
-                },
-                'detailed_issues': [
-                    {
-                        'url': issue.url,
-                        'issue_type': issue.issue_type,
-                        'severity': issue.severity,
-                        'category': issue.category,
-                        'description': issue.description,
-                        'recommendation': issue.recommendation,
-                        'impact_score': issue.impact_score,
-                        'date_detected': issue.date_detected.isoformat(),
-                        'status': issue.status
-                    } for issue in team_data['issues']
-                ]
-            }
+    team_exports = {
+        team_key: {
+            'team_name': team_data['name'],
+            'description': team_data['description'],
+            'summary': {
+                'total_issues': team_data['total_issues'],
+                'critical_issues': team_data['critical_issues'],
+                'high_issues': team_data['high_issues'],
+                'priority_score': team_data['priority_score'],
+                'avg_impact': team_data['avg_impact']
+            },
+            'detailed_issues': [
+                dict(
+                    zip(_ISSUE_EXPORT_FIELDS, _get_issue_export_values(issue)),
+                    date_detected=issue.date_detected.isoformat()
+                ) for issue in team_data['issues']
+            ]
+        }
+        for team_key, team_data in team_breakdown.items()
+        if team_data['total_issues'] > 0
+    }
+    results['team_exports'] = team_exports
     
-    with open('technical_seo_audit_results.json', 'w') as f:
-        json.dump(enhanced_results, f, indent=2, default=str)
+    # json.dump streams chunks to the file; a 1 MiB buffer keeps write syscalls low
+    with open('technical_seo_audit_results.json', 'w', encoding='utf-8', buffering=1 << 20) as f:
+        json.dump(results, f, indent=2, default=str)
     
-    # Print strategic summary
+    # Print strategic summary (buffered and written to stdout once)
     summary = results['summary']
     insights = summary.get('strategic_insights', {})
+    lines = []
+    action_lines = []
+    export_lines = []
+    severity_icons = {'Critical': '🚨', 'High': '⚠️', 'Medium': '🟡'}
     
-    print("\n" + "="*60)
-    print("    STRATEGIC SEO AUDIT SUMMARY")
-    print("="*60)
+    lines.append("\n" + "="*60)
+    lines.append("    STRATEGIC SEO AUDIT SUMMARY")
+    lines.append("="*60)
     
     # Overall score with grade
     score = summary['seo_score']
@@ -1552,99 +1728,95 @@ if __name__ == "__main__":
     else:
         grade, status = 'D', '🔴 CRITICAL'
     
-    print(f"Overall SEO Health: {score:.1f}/100 (Grade: {grade})")
-    print(f"Status: {status}")
+    lines.append(f"Overall SEO Health: {score:.1f}/100 (Grade: {grade})")
+    lines.append(f"Status: {status}")
     
-    print(f"\n📊 ISSUE BREAKDOWN:")
-    print(f"   Total Issues: {summary['total_issues']}")
-    print(f"   Critical: {summary['critical_issues']}, High: {summary['high_issues']}, Medium: {summary['medium_issues']}, Low: {summary['low_issues']}")
+    lines.append(f"\n📊 ISSUE BREAKDOWN:")
+    lines.append(f"   Total Issues: {summary['total_issues']}")
+    lines.append(f"   Critical: {summary['critical_issues']}, High: {summary['high_issues']}, Medium: {summary['medium_issues']}, Low: {summary['low_issues']}")
     
-    print(f"\n⚡ PERFORMANCE:")
-    print(f"   Average Response Time: {summary.get('avg_response_time', 0):.2f}s")
-    print(f"   Pages with Errors: {summary.get('error_pages', 0)}")
+    lines.append(f"\n⚡ PERFORMANCE:")
+    lines.append(f"   Average Response Time: {summary.get('avg_response_time', 0):.2f}s")
+    lines.append(f"   Pages with Errors: {summary.get('error_pages', 0)}")
     
     # Strategic insights
     if insights:
-        print(f"\n🎯 STRATEGIC INSIGHTS:")
-        print(f"   High-Priority Pages with Issues: {insights.get('high_priority_pages_with_issues', 0)}")
+        lines.append(f"\n🎯 STRATEGIC INSIGHTS:")
+        lines.append(f"   High-Priority Pages with Issues: {insights.get('high_priority_pages_with_issues', 0)}")
         
         # Critical business impact
         critical_business = insights.get('critical_business_impact', [])
         if critical_business:
-            print(f"   🚨 Critical Business Impact Pages:")
+            lines.append(f"   🚨 Critical Business Impact Pages:")
             for page in critical_business[:3]:  # Show top 3
-                print(f"     • {page['page_type'].title()}: {page['critical_issues']} critical issues")
+                lines.append(f"     • {page['page_type'].title()}: {page['critical_issues']} critical issues")
         
         # Page type breakdown
         page_breakdown = insights.get('page_type_breakdown', {})
         if page_breakdown:
-            print(f"   📄 Issues by Page Type:")
+            lines.append(f"   📄 Issues by Page Type:")
             for page_type, data in sorted(page_breakdown.items(), key=lambda x: x[1]['issues'], reverse=True)[:4]:
-                print(f"     • {page_type.title()}: {data['issues']} issues across {data['pages']} pages")
+                lines.append(f"     • {page_type.title()}: {data['issues']} issues across {data['pages']} pages")
     
     # Team breakdown
     team_breakdown = summary.get('team_breakdown', {})
     if team_breakdown:
-        print(f"\n💼 TEAM ASSIGNMENTS:")
+        lines.append(f"\n💼 TEAM ASSIGNMENTS:")
         # Sort teams by priority score (critical + high issues)
         sorted_teams = sorted(team_breakdown.items(), key=lambda x: x[1]['priority_score'], reverse=True)
         
+        # One pass over the active teams fills the details here plus the action
+        # summary and export hints, which are printed after the alerts
         for team_key, team_data in sorted_teams:
-            if team_data['total_issues'] > 0:
-                print(f"\n   {team_data['name']}")
-                print(f"   {team_data['description']}")
-                print(f"   📊 Issues: {team_data['total_issues']} total | Critical: {team_data['critical_issues']} | High: {team_data['high_issues']}")
-                print(f"   🎯 Priority Score: {team_data['priority_score']:.0f} | Avg Impact: {team_data['avg_impact']:.1f}")
-                
-                # Show all issues for this team with details
-                team_issues = sorted(team_data['issues'], key=lambda x: x.impact_score, reverse=True)
-                if team_issues:
-                    print(f"   🔴 Issues to Fix ({len(team_issues)} total):")
-                    for i, issue in enumerate(team_issues, 1):
-                        # Severity indicator
-                        if issue.severity == 'Critical':
-                            severity_icon = '🚨'
-                        elif issue.severity == 'High':
-                            severity_icon = '⚠️'
-                        elif issue.severity == 'Medium':
-                            severity_icon = '🟡'
-                        else:
-                            severity_icon = '🔵'
-                        
-                        print(f"     {i}. {severity_icon} {issue.issue_type} ({issue.severity})")
-                        print(f"        📍 URL: {issue.url}")
-                        print(f"        📝 Issue: {issue.description}")
-                        print(f"        💡 Fix: {issue.recommendation}")
-                        print(f"        📊 Impact Score: {issue.impact_score}")
-                        print()  # Empty line for readability
+            if team_data['total_issues'] == 0:
+                continue
+            
+            if team_data['critical_issues'] > 0:
+                urgency = "🚨 URGENT"
+            elif team_data['high_issues'] > 0:
+                urgency = "⚠️ HIGH PRIORITY"
+            else:
+                urgency = "🟡 MEDIUM PRIORITY"
+            action_lines.append(f"   {team_data['name']}: {urgency} - {team_data['total_issues']} issues to resolve")
+            export_lines.append(f"   • {team_data['name']}: 'team_breakdown' → '{team_key}' → 'issues'")
+            
+            lines.append(f"\n   {team_data['name']}")
+            lines.append(f"   {team_data['description']}")
+            lines.append(f"   📊 Issues: {team_data['total_issues']} total | Critical: {team_data['critical_issues']} | High: {team_data['high_issues']}")
+            lines.append(f"   🎯 Priority Score: {team_data['priority_score']:.0f} | Avg Impact: {team_data['avg_impact']:.1f}")
+            
+            # Show all issues for this team with details
+            team_issues = sorted(team_data['issues'], key=operator.attrgetter('impact_score'), reverse=True)
+            if team_issues:
+                lines.append(f"   🔴 Issues to Fix ({len(team_issues)} total):")
+                for i, issue in enumerate(team_issues, 1):
+                    severity_icon = severity_icons.get(issue.severity, '🔵')
+                    lines.append(f"     {i}. {severity_icon} {issue.issue_type} ({issue.severity})")
+                    lines.append(f"        📍 URL: {issue.url}")
+                    lines.append(f"        📝 Issue: {issue.description}")
+                    lines.append(f"        💡 Fix: {issue.recommendation}")
+                    lines.append(f"        📊 Impact Score: {issue.impact_score}")
+                    lines.append("")  # Empty line for readability
     
     # Alerts
     if summary['critical_issues'] > 0:
-        print(f"\n🚨 IMMEDIATE ACTION REQUIRED!")
-        print(f"   {summary['critical_issues']} critical issues found that may impact rankings")
+        lines.append(f"\n🚨 IMMEDIATE ACTION REQUIRED!")
+        lines.append(f"   {summary['critical_issues']} critical issues found that may impact rankings")
     
     if insights.get('high_priority_pages_with_issues', 0) > 0:
-        print(f"\n⚠️  BUSINESS IMPACT ALERT!")
-        print(f"   {insights['high_priority_pages_with_issues']} high-value pages have SEO issues")
+        lines.append(f"\n⚠️  BUSINESS IMPACT ALERT!")
+        lines.append(f"   {insights['high_priority_pages_with_issues']} high-value pages have SEO issues")
     
     # Team action summary
     if team_breakdown:
-        print(f"\n📋 ACTION SUMMARY BY TEAM:")
-        for team_key, team_data in sorted_teams:
-            if team_data['total_issues'] > 0:
-                if team_data['critical_issues'] > 0:
-                    urgency = "🚨 URGENT"
-                elif team_data['high_issues'] > 0:
-                    urgency = "⚠️ HIGH PRIORITY"
-                else:
-                    urgency = "🟡 MEDIUM PRIORITY"
-                print(f"   {team_data['name']}: {urgency} - {team_data['total_issues']} issues to resolve")
+        lines.append(f"\n📋 ACTION SUMMARY BY TEAM:")
+        lines.extend(action_lines)
         
-        print(f"\n📋 DETAILED ISSUE EXPORT:")
-        print(f"   For detailed issue lists per team, check the JSON file sections:")
-        for team_key, team_data in sorted_teams:
-            if team_data['total_issues'] > 0:
-                print(f"   • {team_data['name']}: 'team_breakdown' → '{team_key}' → 'issues'")
+        lines.append(f"\n📋 DETAILED ISSUE EXPORT:")
+        lines.append(f"   For detailed issue lists per team, check the JSON file sections:")
+        lines.extend(export_lines)
+    
+    lines.append(f"\n💾 Detailed results saved to: technical_seo_audit_results.json")
+    lines.append("="*60)
     
-    print(f"\n💾 Detailed results saved to: technical_seo_audit_results.json")
-    print("="*60)
\ No newline at end of file
+    sys.stdout.write("\n".join(lines) + "\n")